@@ -9,6 +9,60 @@ import { fileURLToPath } from 'url';
 const execAsync = promisify(exec);
 const __dirname = path.dirname(fileURLToPath(import.meta.url));
 
+// Look a command up on PATH in-process (like `which`) without spawning a shell
+async function commandExists(command) {
+  const extensions = process.platform === 'win32'
+    ? (process.env.PATHEXT || '.EXE;.CMD;.BAT').split(';')
+    : [''];
+  
+  for (const dir of (process.env.PATH || '').split(path.delimiter)) {
+    if (!dir) continue;
+    for (const ext of extensions) {
+      try {
+        await fs.access(path.join(dir, command + ext), fs.constants.X_OK);
+        return true;
+      } catch {
+        // Not in this directory
+      }
+    }
+  }
+  return false;
+}
+
+// Write JSON only when the serialized content differs from what is on disk.
+// The file is replaced atomically so an interrupted run never leaves it truncated.
+async function writeJsonIfChanged(filePath, data) {
+  const serialized = JSON.stringify(data, null, 2) + '\n';
+  
+  try {
+    if (await fs.readFile(filePath, 'utf8') === serialized) {
+      return false;
+    }
+  } catch {
+    // No existing file
+  }
+  
+  const tmpPath = path.join(
+    path.dirname(filePath),
+    `.${path.basename(filePath)}.${process.pid}.tmp`
+  );
+  
+  try {
+    const handle = await fs.promises.open(tmpPath, 'w');
+    try {
+      await handle.writeFile(serialized);
+      await handle.sync();
+    } finally {
+      await handle.close();
+    }
+    await fs.rename(tmpPath, filePath);
+  } catch (error) {
+    await fs.remove(tmpPath);
+    throw error;
+  }
+  return true;
+}
+
 async function setupDebo() {
   console.log('🚀 Setting up Debo Autonomous Development System...\n');
 
@@ -39,14 +93,16 @@ async function setupDebo() {
     // 2. Check Ollama
     console.log('\n🤖 Checking Ollama...');
     try {
-      await execAsync('ollama --version');
+      if (!(await commandExists('ollama'))) {
+        throw new Error('Ollama not found');
+      }
       console.log('✅ Ollama is installed');
       
-      // Pull required models
+      // Pull required models (independent downloads, so run them together)
       console.log('📥 Pulling required models (this may take a while)...');
       const models = ['qwen2.5:7b', 'qwen2.5:14b'];
       
-      for (const model of models) {
+      await Promise.all(models.map(async (model) => {
         try {
           console.log(`   Pulling ${model}...`);
           await execAsync(`ollama pull ${model}`);
@@ -54,7 +110,7 @@ async function setupDebo() {
         } catch (pullError) {
           console.log(`   ⚠️  Failed to pull ${model}, will try later`);
         }
-      }
+      }));
       
     } catch (error) {
       console.log('❌ Ollama not found');
@@ -100,8 +156,11 @@ async function setupDebo() {
       }
     };
     
-    await fs.writeJson(configPath, config, { spaces: 2 });
-    console.log('✅ Configuration saved');
+    if (await writeJsonIfChanged(configPath, config)) {
+      console.log('✅ Configuration saved');
+    } else {
+      console.log('✅ Configuration already up to date');
+    }
 
     // 5. Test the system
     console.log('\n🧪 Testing system components...');
@@ -27,7 +27,13 @@ install_deps() {
         echo "Installing Ollama..."
         curl -fsSL https://ollama.com/install.sh | sh
         ollama serve &
-        sleep 5
+        ollama_pid=$!
+        # Wait until the API answers (max ~10s) instead of a fixed sleep
+        for i in $(seq 1 100); do
+            curl -sf http://127.0.0.1:11434/api/tags > /dev/null && break
+            kill -0 "$ollama_pid" 2> /dev/null || break
+            sleep 0.1
+        done
     fi
 
     # Python3
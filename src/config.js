@@ -39,6 +39,7 @@ export const config = {
   },
   ollama: {
     baseUrl: process.env.OLLAMA_BASE_URL || 'http://localhost:11434',
+    concurrency: parseInt(process.env.DEBO_LLM_CONCURRENCY || '4'),
     models: {
       thinking: process.env.OLLAMA_THINKING_MODEL || 'qwen2.5:14b',
       fast: process.env.OLLAMA_FAST_MODEL || 'qwen2.5:7b',
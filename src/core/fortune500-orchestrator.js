@@ -24,9 +24,23 @@ import { fortune500Agents } from '../agents/fortune500-roles.js';
 import { DepartmentManager } from '../agents/department-manager.js';
 import { WorkflowEngine } from './workflow-engine.js';
 import { DynamicAgentManager } from '../agents/dynamic-agent-manager.js';
+import { ConcurrencyUtils } from '../utils/shared-utilities.js';
+import { config } from '../config.js';
 import logger from '../logger.js';
 import { v4 as uuidv4 } from 'uuid';
 
+// Request classification keywords, checked in priority order. Compiled once
+// case-insensitive so classification needs no lowercased copy of the request.
+const REQUEST_TYPE_PATTERNS = [
+  ['software_development', /build|create|develop|code|app|software|api|website/i],
+  ['business_strategy', /strategy|plan|growth|expand|market analysis/i],
+  ['marketing_campaign', /marketing|campaign|brand|advertis|promot/i],
+  ['financial_analysis', /financ|budget|revenue|cost|profit|investment/i],
+  ['legal_review', /legal|contract|compliance|regulat|law/i],
+  ['hr_operations', /hire|recruit|talent|employee|hr/i],
+  ['data_analysis', /data|analyt|metric|report|insight/i]
+];
+
 export class Fortune500Orchestrator extends UnifiedOrchestrator {
   constructor(taskManager, llmProvider, websocketServer = null) {
     super(taskManager, llmProvider, websocketServer);
@@ -235,13 +249,13 @@ export class Fortune500Orchestrator extends UnifiedOrchestrator {
    */
   async getExecutiveBuyIn(analysis, sessionId) {
     const buyIn = {};
-    const relevantExecutives = this.determineRelevantExecutives(analysis);
+    const relevantExecutives = this.determineRelevantExecutives(analysis)
+      .filter(exec => exec !== 'ceo' && fortune500Agents[exec]); // CEO already analyzed
 
-    for (const exec of relevantExecutives) {
-      if (exec === 'ceo') continue; // CEO already analyzed
-      
+    // Executive reviews are independent - run them in parallel, bounded so
+    // Ollama is not flooded with concurrent generations
+    await ConcurrencyUtils.mapWithLimit(relevantExecutives, config.ollama.concurrency, async (exec) => {
       const agent = fortune500Agents[exec];
-      if (!agent) continue;
 
       const execResponse = await this.llmProvider.generateResponse(
         agent.systemPrompt,
@@ -254,12 +268,13 @@ export class Fortune500Orchestrator extends UnifiedOrchestrator {
         { temperature: 0.3, model: agent.llmType }
       );
 
+      const responseLower = execResponse.toLowerCase();
       buyIn[exec] = {
         recommendation: execResponse,
-        approved: !execResponse.toLowerCase().includes('concern') && 
-                 !execResponse.toLowerCase().includes('risk')
+        approved: !responseLower.includes('concern') && 
+                 !responseLower.includes('risk')
       };
-    }
+    });
 
     return buyIn;
   }
@@ -646,22 +661,10 @@ export class Fortune500Orchestrator extends UnifiedOrchestrator {
    * Helper methods
    */
   determineRequestType(request) {
-    const lower = request.toLowerCase();
-    
-    if (lower.match(/build|create|develop|code|app|software|api|website/)) {
-      return 'software_development';
-    } else if (lower.match(/strategy|plan|growth|expand|market analysis/)) {
-      return 'business_strategy';
-    } else if (lower.match(/marketing|campaign|brand|advertis|promot/)) {
-      return 'marketing_campaign';
-    } else if (lower.match(/financ|budget|revenue|cost|profit|investment/)) {
-      return 'financial_analysis';
-    } else if (lower.match(/legal|contract|compliance|regulat|law/)) {
-      return 'legal_review';
-    } else if (lower.match(/hire|recruit|talent|employee|hr/)) {
-      return 'hr_operations';
-    } else if (lower.match(/data|analyt|metric|report|insight/)) {
-      return 'data_analysis';
+    for (const [type, pattern] of REQUEST_TYPE_PATTERNS) {
+      if (pattern.test(request)) {
+        return type;
+      }
     }
     
     return 'general';
@@ -721,16 +724,16 @@ export class Fortune500Orchestrator extends UnifiedOrchestrator {
   extractDepartments(text) {
     const departments = [];
     const deptNames = Object.keys(this.hierarchy.departments);
+    const textLower = text.toLowerCase();
     
     for (const dept of deptNames) {
-      if (text.toLowerCase().includes(dept)) {
+      if (textLower.includes(dept)) {
         departments.push(dept);
       }
     }
     
     // Default departments if none found
     if (departments.length === 0) {
-      const textLower = text.toLowerCase();
       if (textLower.includes('software') || textLower.includes('code')) {
         departments.push('engineering', 'product');
       } else if (textLower.includes('market')) {
@@ -424,12 +424,14 @@ export class GenericOrchestrator extends UnifiedOrchestrator {
       request: llmResponse
     };
     
-    if (llmResponse.toLowerCase().includes('create') && 
-        llmResponse.toLowerCase().includes('agent')) {
+    const responseLower = llmResponse.toLowerCase();
+    
+    if (responseLower.includes('create') && 
+        responseLower.includes('agent')) {
       analysis.type = 'agent_creation';
-    } else if (llmResponse.toLowerCase().includes('software') ||
-               llmResponse.toLowerCase().includes('code') ||
-               llmResponse.toLowerCase().includes('app')) {
+    } else if (responseLower.includes('software') ||
+               responseLower.includes('code') ||
+               responseLower.includes('app')) {
       analysis.type = 'software_development';
     } else if (llmResponse.match(/\?|what|how|why|when|where/i)) {
       analysis.type = 'knowledge_query';
@@ -668,8 +670,9 @@ export class GenericOrchestrator extends UnifiedOrchestrator {
    */
   async handleSoftwareRequest(analysis, context) {
     // Determine if it's a new project or feature addition
-    if (analysis.request.toLowerCase().includes('create') || 
-        analysis.request.toLowerCase().includes('build')) {
+    const requestLower = analysis.request.toLowerCase();
+    if (requestLower.includes('create') || 
+        requestLower.includes('build')) {
       // New project
       const projectName = this.extractProjectName(analysis.request) || `project_${Date.now()}`;
       const requirements = analysis.request;
@@ -699,12 +702,25 @@ export class GenericOrchestrator extends UnifiedOrchestrator {
 
   async identifyProject(request) {
     // Try to identify project from request
-    const projects = await this.taskManager.redis.keys('project:*');
-    
+    const redis = this.taskManager.redis;
+    const projects = [];
+    // SCAN doesn't block Redis like KEYS; TYPE skips project:{id}:* sub-keys
+    for await (const key of redis.scanIterator({ MATCH: 'project:*', COUNT: 100, TYPE: 'hash' })) {
+      projects.push(key);
+    }
+    if (projects.length === 0) return null;
+
+    const pipeline = redis.multi();
     for (const projectKey of projects) {
-      const projectData = await this.taskManager.redis.hGetAll(projectKey);
-      if (request.toLowerCase().includes(projectData.name?.toLowerCase())) {
-        return projectKey.replace('project:', '');
+      pipeline.hGetAll(projectKey);
+    }
+    const projectsData = await pipeline.execAsPipeline();
+    const requestLower = request.toLowerCase();
+    
+    for (let i = 0; i < projects.length; i++) {
+      const name = projectsData[i].name?.toLowerCase();
+      if (name && requestLower.includes(name)) {
+        return projects[i].replace('project:', '');
       }
     }
     
@@ -125,17 +125,16 @@ export class ConfidenceEvaluator {
       'not sure', 'uncertain', 'guess', 'assume'
     ];
     
-    const hasUncertainty = uncertaintyIndicators.some(indicator =>
-      response.toLowerCase().includes(indicator)
+    const responseLower = response.toLowerCase();
+    const foundIndicators = uncertaintyIndicators.filter(indicator =>
+      responseLower.includes(indicator)
     );
     
     return {
       explicit: extractedScore,
       reasoning: extractedReasoning,
-      hasUncertainty,
-      uncertaintyIndicators: uncertaintyIndicators.filter(indicator =>
-        response.toLowerCase().includes(indicator)
-      )
+      hasUncertainty: foundIndicators.length > 0,
+      uncertaintyIndicators: foundIndicators
     };
   }
 
@@ -253,9 +252,10 @@ export class ConfidenceEvaluator {
     
     let foundDeliverables = 0;
     const totalDeliverables = Object.keys(deliverables).length;
+    const responseLower = response.toLowerCase();
     
     for (const deliverable of Object.keys(deliverables)) {
-      if (response.toLowerCase().includes(deliverable.toLowerCase())) {
+      if (responseLower.includes(deliverable.toLowerCase())) {
         foundDeliverables++;
       }
     }
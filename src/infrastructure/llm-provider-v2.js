@@ -1,4 +1,4 @@
-import { exec } from 'child_process';
+import { exec, spawn } from 'child_process';
 import { promisify } from 'util';
 import logger from '../logger.js';
 import { ContextManager } from './context-manager.js';
@@ -27,6 +27,7 @@ export class LLMProviderV2 {
   constructor(taskManager) {
     this.taskManager = taskManager;
     this.ollamaUrl = 'http://localhost:11434';
+    this.keepAlive = process.env.OLLAMA_KEEP_ALIVE || '30m'; // Keep models resident between agent calls
     this.contextManager = new ContextManager(taskManager);
     this.confidenceEvaluator = new ConfidenceEvaluator(taskManager, this);
     
@@ -155,46 +156,23 @@ export class LLMProviderV2 {
     const startTime = Date.now();
     
     try {
-      const response = await fetch(`${this.ollamaUrl}/api/generate`, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json'
-        },
-        body: JSON.stringify({
-          model: model.name,
-          prompt: context.userPrompt,
-          system: context.systemPrompt,
-          stream: false,
-          options: {
-            temperature: model.temperature,  // Always 0.0 for no hallucination
-            top_p: 0.95,  // Focused responses
-            top_k: 40,    // Limited token selection
-            max_tokens: model.maxTokens,
-            num_predict: model.maxTokens,
-            repeat_penalty: 1.1,
-            stop: ['Human:', 'Assistant:', '```\n\n'],
-            ...options
-          }
-        })
-      });
-
-      if (!response.ok) {
-        throw new Error(`Model request failed: ${response.status} ${response.statusText}`);
+      // Assemble the streamed chunks so callers get the full response
+      let content = '';
+      for await (const chunk of this.streamModel(model, context, options)) {
+        content += chunk;
       }
-
-      const result = await response.json();
       
-      if (!result.response) {
+      if (!content) {
         throw new Error('Empty response from model');
       }
 
       const executionTime = Date.now() - startTime;
-      const tokenCount = this.estimateTokens(result.response);
+      const tokenCount = this.estimateTokens(content);
       
       logger.debug(`Model ${model.name} responded in ${executionTime}ms (${tokenCount} tokens)`);
       
       return {
-        content: result.response,
+        content,
         tokens: tokenCount,
         executionTime,
         model: model.name
@@ -206,6 +184,68 @@ export class LLMProviderV2 {
     }
   }
 
+  /**
+   * Stream a generation from Ollama, yielding response text as it arrives.
+   * Ollama emits newline-delimited JSON objects when stream is enabled.
+   */
+  async *streamModel(model, context, options = {}) {
+    const response = await fetch(`${this.ollamaUrl}/api/generate`, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json'
+      },
+      body: JSON.stringify({
+        model: model.name,
+        prompt: context.userPrompt,
+        system: context.systemPrompt,
+        stream: true,
+        keep_alive: this.keepAlive,
+        options: {
+          temperature: model.temperature,  // Always 0.0 for no hallucination
+          top_p: 0.95,  // Focused responses
+          top_k: 40,    // Limited token selection
+          max_tokens: model.maxTokens,
+          num_predict: model.maxTokens,
+          repeat_penalty: 1.1,
+          stop: ['Human:', 'Assistant:', '```\n\n'],
+          ...options
+        }
+      })
+    });
+
+    if (!response.ok) {
+      throw new Error(`Model request failed: ${response.status} ${response.statusText}`);
+    }
+
+    const decoder = new TextDecoder();
+    let buffered = '';
+    
+    for await (const bytes of response.body) {
+      buffered += decoder.decode(bytes, { stream: true });
+      
+      const lines = buffered.split('\n');
+      buffered = lines.pop();
+      
+      for (const line of lines) {
+        const chunk = this.parseStreamChunk(line);
+        if (chunk) yield chunk;
+      }
+    }
+    
+    const chunk = this.parseStreamChunk(buffered + decoder.decode());
+    if (chunk) yield chunk;
+  }
+
+  parseStreamChunk(line) {
+    if (!line.trim()) return '';
+    
+    const data = JSON.parse(line);
+    if (data.error) {
+      throw new Error(`Model stream failed: ${data.error}`);
+    }
+    return data.response || '';
+  }
+
   getModelTypeForRole(role) {
     const thinkingRoles = [
       'cto', 'engineering_manager', 'product_manager',
@@ -242,13 +282,44 @@ export class LLMProviderV2 {
     }
   }
 
-  async startOllama() {
+  async startOllama(timeout = 10000) {
+    const server = spawn('ollama', ['serve'], { detached: true, stdio: 'ignore' });
+    let exited = false;
+    server.on('error', () => { exited = true; });
+    server.on('exit', () => { exited = true; });
+    server.unref();
+    
+    // Poll the API with backoff rather than sleeping a fixed interval
+    const deadline = Date.now() + timeout;
+    let delay = 50;
+    
+    while (Date.now() < deadline) {
+      if (await this.isOllamaResponding()) {
+        logger.info('✅ Ollama service started');
+        return;
+      }
+      if (exited) {
+        break; // Server died (or another instance already owns the port)
+      }
+      await new Promise(resolve => setTimeout(resolve, delay));
+      delay = Math.min(delay * 2, 1000);
+    }
+    
+    if (await this.isOllamaResponding()) {
+      logger.info('✅ Ollama service is running');
+      return;
+    }
+    throw new Error('Failed to start Ollama service');
+  }
+
+  async isOllamaResponding() {
     try {
-      await execAsync('ollama serve &');
-      await new Promise(resolve => setTimeout(resolve, 5000));
-      await this.checkOllamaStatus();
+      const response = await fetch(`${this.ollamaUrl}/api/tags`, {
+        signal: AbortSignal.timeout(500)
+      });
+      return response.ok;
     } catch (error) {
-      throw new Error('Failed to start Ollama service');
+      return false;
     }
   }
 
@@ -171,6 +171,63 @@ class DatabaseService extends EventEmitter {
         return await pipeline.exec();
     }
 
+    // Non-blocking key enumeration (SCAN instead of KEYS)
+    // Pass type (e.g. 'hash') to skip sub-keys such as project:{id}:features
+    async scanKeys(pattern, type = null, count = 100) {
+        const options = { MATCH: pattern, COUNT: count };
+        if (type) options.TYPE = type;
+
+        const keys = [];
+        for await (const key of this.redis.scanIterator(options)) {
+            keys.push(key);
+        }
+        return keys;
+    }
+
+    // Fetch many hashes in a single round-trip
+    async hGetAllPipelined(keys) {
+        if (keys.length === 0) return [];
+
+        const pipeline = this.redis.multi();
+        for (const key of keys) {
+            pipeline.hGetAll(key);
+        }
+
+        return await pipeline.execAsPipeline();
+    }
+
+    // One-time migration: add keys written before a SET index existed.
+    // The NX marker makes it run once per database, whatever the index holds.
+    // v2 also prunes non-hash sub-keys that the first backfill picked up.
+    async backfillIndex(indexKey, pattern) {
+        const markerKey = `${indexKey}:backfilled:v2`;
+        const claimed = await this.redis.set(markerKey, '1', { NX: true });
+        if (!claimed) return;
+
+        try {
+            const keys = await this.scanKeys(pattern, 'hash');
+            if (keys.length) {
+                await this.redis.sAdd(indexKey, keys);
+            }
+
+            const members = await this.redis.sMembers(indexKey);
+            const pipeline = this.redis.multi();
+            for (const member of members) {
+                pipeline.type(member);
+            }
+            const types = members.length ? await pipeline.execAsPipeline() : [];
+            const stale = members.filter((_, i) => types[i] !== 'hash');
+            if (stale.length) {
+                await this.redis.sRem(indexKey, stale);
+            }
+
+            logger.info(`Backfilled ${indexKey} with ${keys.length} keys, pruned ${stale.length}`);
+        } catch (error) {
+            await this.redis.del(markerKey); // Retry on next startup
+            throw error;
+        }
+    }
+
     chunkArray(array, chunkSize) {
         const chunks = [];
         for (let i = 0; i < array.length; i += chunkSize) {
@@ -229,10 +286,15 @@ class ProjectService {
     constructor(db) {
         this.db = db;
         this.keyPrefix = 'project:';
-        this.metrics = { reads: 0, writes: 0, deletes: 0 };
+        this.indexKey = 'project_index';
+        this.cache = new Map();
+        this.cacheTTL = 5000; // Short-lived: projects are re-read on every task execution
+        this.cacheMaxSize = 128;
+        this.metrics = { reads: 0, writes: 0, deletes: 0, cacheHits: 0 };
     }
 
     async initialize() {
+        await this.db.backfillIndex(this.indexKey, `${this.keyPrefix}*`);
         logger.info('Project service initialized');
     }
 
@@ -246,15 +308,39 @@ class ProjectService {
         };
         
         await this.db.redis.hSet(key, projectData);
+        await this.db.redis.sAdd(this.indexKey, key);
+        this.cache.delete(projectId);
         this.metrics.writes++;
         return projectData;
     }
 
     async get(projectId) {
+        const cached = this.cache.get(projectId);
+        if (cached) {
+            if (cached.expiresAt > Date.now()) {
+                this.metrics.cacheHits++;
+                return cached.data;
+            }
+            this.cache.delete(projectId);
+        }
+
         const key = `${this.keyPrefix}${projectId}`;
         const data = await this.db.redis.hGetAll(key);
         this.metrics.reads++;
-        return Object.keys(data).length ? data : null;
+        
+        // Misses are not cached so projects created elsewhere show up immediately
+        if (!Object.keys(data).length) return null;
+        
+        this.cacheProject(projectId, data);
+        return data;
+    }
+
+    cacheProject(projectId, data) {
+        // Map iteration order is insertion order, so the first key is the oldest
+        if (this.cache.size >= this.cacheMaxSize) {
+            this.cache.delete(this.cache.keys().next().value);
+        }
+        this.cache.set(projectId, { data, expiresAt: Date.now() + this.cacheTTL });
     }
 
     async update(projectId, updates) {
@@ -265,6 +351,7 @@ class ProjectService {
         };
         
         await this.db.redis.hSet(key, updateData);
+        this.cache.delete(projectId);
         this.metrics.writes++;
         return updateData;
     }
@@ -272,20 +359,18 @@ class ProjectService {
     async delete(projectId) {
         const key = `${this.keyPrefix}${projectId}`;
         const result = await this.db.redis.del(key);
+        await this.db.redis.sRem(this.indexKey, key);
+        this.cache.delete(projectId);
         this.metrics.deletes++;
         return result > 0;
     }
 
     async list(pattern = '*') {
-        const keys = await this.db.redis.keys(`${this.keyPrefix}${pattern}`);
-        const projects = [];
-        
-        for (const key of keys) {
-            const data = await this.db.redis.hGetAll(key);
-            if (Object.keys(data).length) {
-                projects.push(data);
-            }
-        }
+        const keys = pattern === '*'
+            ? await this.db.redis.sMembers(this.indexKey)
+            : await this.db.scanKeys(`${this.keyPrefix}${pattern}`, 'hash');
+        const results = await this.db.hGetAllPipelined(keys);
+        const projects = results.filter(data => Object.keys(data).length);
         
         this.metrics.reads += keys.length;
         return projects;
@@ -379,10 +464,12 @@ class AgentService {
         this.db = db;
         this.keyPrefix = 'agent:';
         this.statePrefix = 'agent_state:';
+        this.indexKey = 'agent_index';
         this.metrics = { reads: 0, writes: 0, deletes: 0, states: 0 };
     }
 
     async initialize() {
+        await this.db.backfillIndex(this.indexKey, `${this.keyPrefix}*`);
         logger.info('Agent service initialized');
     }
 
@@ -396,6 +483,7 @@ class AgentService {
         };
         
         await this.db.redis.hSet(key, agentData);
+        await this.db.redis.sAdd(this.indexKey, key);
         this.metrics.writes++;
         return agentData;
     }
@@ -421,6 +509,7 @@ class AgentService {
         await this.db.redis.hSet(`${this.keyPrefix}${agentId}`, {
             lastActive: new Date().toISOString()
         });
+        await this.db.redis.sAdd(this.indexKey, `${this.keyPrefix}${agentId}`);
         
         this.metrics.states++;
         return stateData;
@@ -434,15 +523,9 @@ class AgentService {
     }
 
     async listActiveAgents() {
-        const keys = await this.db.redis.keys(`${this.keyPrefix}*`);
-        const agents = [];
-        
-        for (const key of keys) {
-            const data = await this.db.redis.hGetAll(key);
-            if (Object.keys(data).length) {
-                agents.push(data);
-            }
-        }
+        const keys = await this.db.redis.sMembers(this.indexKey);
+        const results = await this.db.hGetAllPipelined(keys);
+        const agents = results.filter(data => Object.keys(data).length);
         
         this.metrics.reads += keys.length;
         return agents;
@@ -76,4 +76,31 @@ export class CryptoUtils {
     static hashString(input) {
         return crypto.createHash('sha256').update(input).digest('hex');
     }
-}
\ No newline at end of file
+}
+
+export class ConcurrencyUtils {
+    // Map over items with at most `limit` operations in flight
+    static async mapWithLimit(items, limit, operation) {
+        const results = new Array(items.length);
+        let next = 0;
+        let failed = false;
+        
+        const worker = async () => {
+            // Stop taking new items once any operation has rejected
+            while (!failed && next < items.length) {
+                const index = next++;
+                try {
+                    results[index] = await operation(items[index], index);
+                } catch (error) {
+                    failed = true;
+                    throw error;
+                }
+            }
+        };
+        
+        const maxWorkers = Number.isFinite(limit) ? limit : 1;
+        const workerCount = Math.max(1, Math.min(maxWorkers, items.length));
+        await Promise.all(Array.from({ length: workerCount }, worker));
+        return results;
+    }
+}
@@ -1,9 +1,7 @@
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import auth, users, items
+from app.api.v1.endpoints import auth
 
 api_router = APIRouter()
 
-api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
-api_router.include_router(users.router, prefix="/users", tags=["users"])
-api_router.include_router(items.router, prefix="/items", tags=["items"])
\ No newline at end of file
+api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
\ No newline at end of file
@@ -1,10 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from datetime import timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import settings
-from app.core.security import create_access_token, verify_password
-from app.db.database import get_db
+from app.core.config import Settings, get_settings
+from app.core.security import access_token_expires, create_access_token
+from app.db.database import get_async_db
 from app.schemas.token import Token
 from app.schemas.user import UserCreate, User
 from app.crud import user as crud_user
@@ -12,27 +11,32 @@ from app.crud import user as crud_user
 router = APIRouter()
 
 @router.post("/register", response_model=User)
-def register(user_in: UserCreate, db: Session = Depends(get_db)):
-    user = crud_user.get_user_by_email(db, email=user_in.email)
+async def register(user_in: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    user = await crud_user.get_user_by_email(db, email=user_in.email)
     if user:
         raise HTTPException(
             status_code=400,
             detail="Email already registered"
         )
-    user = crud_user.create_user(db, user=user_in)
+    user = await crud_user.create_user(db, user=user_in)
     return user
 
 @router.post("/login", response_model=Token)
-def login(form_data: UserCreate, db: Session = Depends(get_db)):
-    user = crud_user.authenticate_user(db, email=form_data.email, password=form_data.password)
+async def login(
+    form_data: UserCreate,
+    db: AsyncSession = Depends(get_async_db),
+    settings: Settings = Depends(get_settings),
+):
+    user = await crud_user.authenticate_user(db, email=form_data.email, password=form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.email}, expires_delta=access_token_expires
+        data={"sub": user.email},
+        expires_delta=access_token_expires(settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+        config=settings,
     )
     return {"access_token": access_token, "token_type": "bearer"}
\ No newline at end of file
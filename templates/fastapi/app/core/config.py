@@ -1,20 +1,30 @@
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import List
 
 class Settings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", frozen=True)
+    
     PROJECT_NAME: str = "{{projectName}}"
     VERSION: str = "1.0.0"
     API_V1_STR: str = "/api/v1"
+    DEBUG: bool = False
     
-    DATABASE_URL: str = "sqlite:///./{{projectName}}.db"
+    DATABASE_URL: str = "sqlite+aiosqlite:///./{{projectName}}.db"
+    RUN_MIGRATIONS: bool = False
     
     SECRET_KEY: str = "your-secret-key-here"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
     BACKEND_CORS_ORIGINS: List[str] = ["http://localhost:3000"]
-    
-    class Config:
-        env_file = ".env"
+    ALLOW_METHODS: List[str] = ["GET", "POST", "PUT", "DELETE", "OPTIONS"]
+    ALLOW_HEADERS: List[str] = ["Authorization", "Content-Type"]
+    # Chromium caps preflight caching at 2 hours; Starlette defaults to 600s
+    CORS_MAX_AGE: int = 7200
+
+@lru_cache
+def get_settings() -> Settings:
+    return Settings()
 
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
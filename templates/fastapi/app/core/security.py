@@ -1,24 +1,50 @@
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
-from app.core.config import settings
+from app.core.config import Settings, get_settings, settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Fewer bcrypt rounds in debug mode keeps local login/register fast
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=10 if settings.DEBUG else 12,
+)
+
+# Hashed once at import so the first unknown-email login costs the same as any other
+_DUMMY_HASH = pwd_context.hash("dummy-password-for-timing-parity")
+
+_DEFAULT_TOKEN_EXPIRES = timedelta(minutes=15)
 
 def verify_password(plain_password, hashed_password):
     return pwd_context.verify(plain_password, hashed_password)
 
+def dummy_verify_password(plain_password):
+    # Same bcrypt work as a real check; the result is always discarded
+    pwd_context.verify(plain_password, _DUMMY_HASH)
+
 def get_password_hash(password):
     return pwd_context.hash(password)
 
-def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
+# Derived once per distinct value, so overridden settings still take effect
+@lru_cache
+def access_token_expires(minutes: int) -> timedelta:
+    return timedelta(minutes=minutes)
+
+@lru_cache
+def _signing_key(secret_key: str) -> bytes:
+    return secret_key.encode()
+
+def create_access_token(
+    data: dict,
+    expires_delta: Optional[timedelta] = None,
+    config: Optional[Settings] = None,
+):
+    config = config or get_settings()
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=15)
+    expire = datetime.utcnow() + (expires_delta or _DEFAULT_TOKEN_EXPIRES)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _signing_key(config.SECRET_KEY), algorithm=config.ALGORITHM)
     return encoded_jwt
\ No newline at end of file
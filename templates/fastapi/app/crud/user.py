@@ -0,0 +1,36 @@
+import asyncio
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import dummy_verify_password, get_password_hash, verify_password
+from app.models.user import User
+from app.schemas.user import UserCreate
+
+async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
+    result = await db.execute(select(User).where(User.email == email))
+    return result.scalar_one_or_none()
+
+async def create_user(db: AsyncSession, user: UserCreate) -> User:
+    # bcrypt is CPU-bound; hash off the event loop
+    hashed_password = await asyncio.to_thread(get_password_hash, user.password)
+    db_user = User(
+        email=user.email,
+        full_name=user.full_name,
+        hashed_password=hashed_password,
+    )
+    db.add(db_user)
+    await db.commit()
+    await db.refresh(db_user)
+    return db_user
+
+async def authenticate_user(db: AsyncSession, email: str, password: str) -> Optional[User]:
+    user = await get_user_by_email(db, email=email)
+    if not user:
+        # Spend the same hashing time as a real check so unknown emails
+        # can't be distinguished by response timing
+        await asyncio.to_thread(dummy_verify_password, password)
+        return None
+    if not await asyncio.to_thread(verify_password, password, user.hashed_password):
+        return None
+    return user
\ No newline at end of file
@@ -1,26 +1,37 @@
+import asyncio
+import os
+import sys
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 
 from app.core.config import settings
 from app.api.v1.api import api_router
 from app.db.database import engine, Base
 
-# Create tables
-Base.metadata.create_all(bind=engine)
+async def create_tables():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     print("Starting up...")
+    # Create tables only when asked to; production schemas are managed by Alembic
+    if settings.RUN_MIGRATIONS:
+        await create_tables()
     yield
     # Shutdown
     print("Shutting down...")
+    await engine.dispose()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS
@@ -28,8 +39,9 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.BACKEND_CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=settings.ALLOW_METHODS,
+    allow_headers=settings.ALLOW_HEADERS,
+    max_age=settings.CORS_MAX_AGE,
 )
 
 # Routes
@@ -37,4 +49,25 @@ app.include_router(api_router, prefix=settings.API_V1_STR)
 
 @app.get("/health")
 def health_check():
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy"}
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # Create tables once here rather than in every worker's lifespan, where
+    # concurrent CREATE TABLE statements would race; workers inherit the override
+    if settings.RUN_MIGRATIONS:
+        async def _migrate():
+            await create_tables()
+            await engine.dispose()
+
+        asyncio.run(_migrate())
+        os.environ["RUN_MIGRATIONS"] = "0"
+
+    # uvloop and httptools ship with uvicorn[standard]; uvloop has no Windows build
+    uvicorn.run(
+        "main:app",
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=os.cpu_count(),
+    )
\ No newline at end of file
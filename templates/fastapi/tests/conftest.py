@@ -0,0 +1,18 @@
+import os
+import tempfile
+
+import pytest
+
+# Settings are read once at import, so point them at a scratch database first
+_db_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_db_dir}/test.db"
+os.environ["RUN_MIGRATIONS"] = "1"
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from main import app  # noqa: E402
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as c:
+        yield c
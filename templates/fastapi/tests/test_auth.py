@@ -0,0 +1,35 @@
+def test_register_and_login(client):
+    payload = {"email": "user@example.com", "password": "s3cret-pass", "full_name": "Test User"}
+
+    response = client.post("/api/v1/auth/register", json=payload)
+    assert response.status_code == 200
+    assert response.json()["email"] == payload["email"]
+
+    response = client.post("/api/v1/auth/register", json=payload)
+    assert response.status_code == 400
+
+    response = client.post(
+        "/api/v1/auth/login",
+        json={"email": payload["email"], "password": payload["password"]},
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["token_type"] == "bearer"
+    assert body["access_token"]
+
+def test_login_rejects_bad_credentials(client):
+    response = client.post(
+        "/api/v1/auth/login",
+        json={"email": "nobody@example.com", "password": "whatever"},
+    )
+    assert response.status_code == 401
+
+    client.post("/api/v1/auth/register", json={"email": "known@example.com", "password": "right"})
+    response = client.post(
+        "/api/v1/auth/login",
+        json={"email": "known@example.com", "password": "wrong"},
+    )
+    assert response.status_code == 401
+
+def test_health(client):
+    assert client.get("/health").json() == {"status": "healthy"}